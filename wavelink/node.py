@@ -484,7 +484,7 @@ class Node:
         payload: PlayerResponsePayload = PlayerResponsePayload(data)
         return payload
 
-    async def _update_player(self, guild_id: int, /, *, data: Request, replace: bool = False) -> PlayerResponse:
+    async def _update_player(self, guild_id: int | str, /, *, data: Request, replace: bool = False) -> PlayerResponse:
         no_replace: bool = not replace
 
         uri: str = f"{self.uri}/v4/sessions/{self.session_id}/players/{guild_id}?noReplace={no_replace}"
@@ -503,7 +503,7 @@ class Node:
 
                 raise LavalinkException(data=exc_data)
 
-    async def _destroy_player(self, guild_id: int, /) -> None:
+    async def _destroy_player(self, guild_id: int | str, /) -> None:
         uri: str = f"{self.uri}/v4/sessions/{self.session_id}/players/{guild_id}"
 
         async with self._session.delete(url=uri, headers=self.headers) as resp:
@@ -857,7 +857,7 @@ class Pool:
         if not nodes:
             raise InvalidNodeException("No nodes are currently assigned to the wavelink.Pool in a CONNECTED state.")
 
-        return sorted(nodes, key=lambda n: n._total_player_count or len(n.players))[0]
+        return min(nodes, key=lambda n: n._total_player_count or len(n.players))
 
     @classmethod
     async def fetch_tracks(cls, query: str, /) -> list[Playable] | Playlist:
@@ -26,11 +26,11 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
+import sys
 import time
 from collections import deque
 from typing import TYPE_CHECKING, Any, TypeAlias
 
-import async_timeout
 import disnake
 from disnake.abc import Connectable
 from disnake.utils import MISSING
@@ -61,6 +61,13 @@ if TYPE_CHECKING:
     from .types.state import PlayerVoiceState, VoiceState
 
     VocalGuildChannel = disnake.VoiceChannel | disnake.StageChannel
+    PendingUpdate = tuple[RequestPayload, bool, asyncio.Future[None]]
+
+
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as _timeout
+else:
+    from async_timeout import timeout as _timeout
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -81,12 +88,49 @@ class Player(disnake.VoiceProtocol):
         in disnake, including ``guild.voice_client``, ``ctx.voice_client`` and ``interaction.voice_client``.
     """
 
+    __slots__ = (
+        "client",
+        "channel",
+        "_last_channel_id",
+        "_guild",
+        "_guild_id",
+        "_guild_id_str",
+        "_voice_state",
+        "_node",
+        "_last_update",
+        "_last_position",
+        "_ping",
+        "_connected",
+        "_connect_future",
+        "_current",
+        "_original",
+        "_previous",
+        "queue",
+        "auto_queue",
+        "_volume",
+        "_paused",
+        "_auto_cutoff",
+        "_auto_weight",
+        "_previous_seeds_cutoff",
+        "_history_count",
+        "_autoplay",
+        "__previous_seeds",
+        "_auto_lock",
+        "_error_count",
+        "_filters",
+        "_pending_updates",
+        "_update_task",
+        "_destroyed",
+    )
+
     channel: VocalGuildChannel
 
     def __call__(self, client: disnake.Client, channel: VocalGuildChannel) -> Self:
         super().__init__(client, channel)
 
         self._guild = channel.guild
+        self._guild_id = self._guild.id
+        self._guild_id_str = str(self._guild_id)
 
         return self
 
@@ -97,14 +141,17 @@ class Player(disnake.VoiceProtocol):
 
         self.client: disnake.Client = client
         self._guild: disnake.Guild | None = None
+        self._guild_id: int = 0
+        self._guild_id_str: str = ""
 
         self._voice_state: PlayerVoiceState = {"voice": {}}
+        self._last_channel_id: int = 0
 
         self._node: Node
         if not nodes:
             self._node = Pool.get_node()
         else:
-            self._node = sorted(nodes, key=lambda n: len(n.players))[0]
+            self._node = min(nodes, key=lambda n: len(n.players))
 
         if self.client is MISSING and self.node.client:
             self.client = self.node.client
@@ -114,7 +161,7 @@ class Player(disnake.VoiceProtocol):
         self._ping: int = -1
 
         self._connected: bool = False
-        self._connection_event: asyncio.Event = asyncio.Event()
+        self._connect_future: asyncio.Future[None] | None = None
 
         self._current: Playable | None = None
         self._original: Playable | None = None
@@ -139,6 +186,10 @@ class Player(disnake.VoiceProtocol):
 
         self._filters: Filters = Filters()
 
+        self._pending_updates: deque[PendingUpdate] = deque()
+        self._update_task: asyncio.Task[None] | None = None
+        self._destroyed: bool = False
+
     async def _auto_play_event(self, payload: TrackEndEventPayload) -> None:
         if self._autoplay is AutoPlayMode.disabled:
             return
@@ -454,38 +505,46 @@ class Player(disnake.VoiceProtocol):
         self._connected = True
 
         self._voice_state["voice"]["session_id"] = data["session_id"]
-        self.channel = self.client.get_channel(int(channel_id))  # type: ignore
+
+        # Voice state updates are received for every mute/deafen, only resolve the channel when it changes.
+        # The cached id is reset whenever the voice connection is re-established, so rebuilt channels are picked up...
+        cid: int = int(channel_id)
+        if cid != self._last_channel_id:
+            self.channel = self.client.get_channel(cid)  # type: ignore
+            self._last_channel_id = cid if self.channel else 0
 
     async def on_voice_server_update(self, data: VoiceServerUpdatePayload, /) -> None:
+        self._last_channel_id = 0
+
         self._voice_state["voice"]["token"] = data["token"]
         self._voice_state["voice"]["endpoint"] = data["endpoint"]
 
         await self._dispatch_voice_update()
 
     async def _dispatch_voice_update(self) -> None:
-        assert self.guild is not None
         data: VoiceState = self._voice_state["voice"]
 
-        try:
-            session_id: str = data["session_id"]
-            token: str = data["token"]
-        except KeyError:
-            return
+        session_id: str | None = data.get("session_id")
+        token: str | None = data.get("token")
+        endpoint: str | None = data.get("endpoint")
 
-        endpoint: str | None = data.get("endpoint", None)
-        if not endpoint:
+        if not (session_id and token and endpoint):
             return
 
         request: RequestPayload = {"voice": {"sessionId": session_id, "token": token, "endpoint": endpoint}}
 
         try:
-            await self.node._update_player(self.guild.id, data=request)
+            await self._update(request)
+        except InvalidChannelStateException:
+            return
         except LavalinkException:
             await self.disconnect()
         else:
-            self._connection_event.set()
+            future: asyncio.Future[None] | None = self._connect_future
+            if future and not future.done():
+                future.set_result(None)
 
-        logger.debug(f"Player {self.guild.id} is dispatching VOICE_UPDATE.")
+        logger.debug(f"Player {self._guild_id} is dispatching VOICE_UPDATE.")
 
     async def connect(
         self, *, timeout: float = 10.0, reconnect: bool, self_deaf: bool = False, self_mute: bool = False
@@ -505,7 +564,8 @@ class Player(disnake.VoiceProtocol):
         ChannelTimeoutException
             Connecting to the voice channel timed out.
         InvalidChannelStateException
-            You tried to connect this player without an appropriate voice channel.
+            You tried to connect this player without an appropriate voice channel, or the player was disconnected
+            before the connection completed.
         """
         if self.channel is MISSING:
             msg: str = 'Please use "disnake.VoiceChannel.connect(cls=...)" and pass this Player to cls.'
@@ -513,17 +573,27 @@ class Player(disnake.VoiceProtocol):
 
         if not self._guild:
             self._guild = self.channel.guild
-            self.node._players[self._guild.id] = self
+            self._guild_id = self._guild.id
+            self._guild_id_str = str(self._guild_id)
+            self.node._players[self._guild_id] = self
+
+        self._destroyed = False
 
         assert self.guild is not None
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._connect_future = future
+
         await self.guild.change_voice_state(channel=self.channel, self_mute=self_mute, self_deaf=self_deaf)
 
         try:
-            async with async_timeout.timeout(timeout):
-                await self._connection_event.wait()
+            async with _timeout(timeout):
+                await future
         except (asyncio.TimeoutError, asyncio.CancelledError):
             msg = f"Unable to connect to {self.channel} as it exceeded the timeout of {timeout} seconds."
             raise ChannelTimeoutException(msg)
+        finally:
+            if self._connect_future is future:
+                self._connect_future = None
 
     async def move_to(
         self,
@@ -553,12 +623,15 @@ class Player(disnake.VoiceProtocol):
         ChannelTimeoutException
             Connecting to the voice channel timed out.
         InvalidChannelStateException
-            You tried to connect this player without an appropriate guild.
+            You tried to connect this player without an appropriate guild, or the player was disconnected
+            before the connection completed.
         """
         if not self.guild:
             raise InvalidChannelStateException("Player tried to move without a valid guild.")
 
-        self._connection_event.clear()
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._connect_future = future
+
         voice: disnake.VoiceState | None = self.guild.me.voice
 
         if self_deaf is None and voice:
@@ -572,15 +645,18 @@ class Player(disnake.VoiceProtocol):
 
         await self.guild.change_voice_state(channel=channel, self_mute=self_mute, self_deaf=self_deaf)
 
-        if channel is None:
-            return
-
         try:
-            async with async_timeout.timeout(timeout):
-                await self._connection_event.wait()
+            if channel is None:
+                return
+
+            async with _timeout(timeout):
+                await future
         except (asyncio.TimeoutError, asyncio.CancelledError):
             msg = f"Unable to connect to {channel} as it exceeded the timeout of {timeout} seconds."
             raise ChannelTimeoutException(msg)
+        finally:
+            if self._connect_future is future:
+                self._connect_future = None
 
     async def play(
         self,
@@ -642,19 +718,20 @@ class Player(disnake.VoiceProtocol):
 
             Added the ``filters`` keyword-only argument.
         """
-        assert self.guild is not None
-
-        original_vol: int = self._volume
-        vol: int = volume or self._volume
-
-        if vol != self._volume:
+        # Snapshot the state restored should Lavalink reject this track...
+        old_current: Playable | None = self._current
+        old_original: Playable | None = self._original
+        old_previous: Playable | None = self._previous
+        old_volume: int = self._volume
+
+        vol: int = volume or old_volume
+        if vol != old_volume:
             self._volume = vol
 
         if replace or not self._current:
             self._current = track
             self._original = track
 
-        old_previous = self._previous
         self._previous = self._current
 
         pause: bool
@@ -676,13 +753,13 @@ class Player(disnake.VoiceProtocol):
         }
 
         try:
-            await self.node._update_player(self.guild.id, data=request, replace=replace)
-        except LavalinkException as e:
-            self._current = None
-            self._original = None
+            await self._update(request, replace=replace)
+        except (LavalinkException, InvalidChannelStateException):
+            self._current = old_current
+            self._original = old_original
             self._previous = old_previous
-            self._volume = original_vol
-            raise e
+            self._volume = old_volume
+            raise
 
         self._paused = pause
 
@@ -692,7 +769,7 @@ class Player(disnake.VoiceProtocol):
 
         return track
 
-    async def pause(self, value: bool, /) -> None:
+    async def pause(self, value: bool, /, *, force: bool = False) -> None:
         """Set the paused or resume state of the player.
 
         Parameters
@@ -700,16 +777,25 @@ class Player(disnake.VoiceProtocol):
         value: bool
             A bool indicating whether the player should be paused or resumed. True indicates that the player should be
             ``paused``. False will resume the player if it is currently paused.
+        force: bool
+            Whether to send the update to Lavalink even if the player is already in the requested state.
+            Defaults to ``False``.
 
 
         .. versionchanged:: 3.0.0
 
             This method now expects a positional-only bool value. The ``resume`` method has been removed.
+
+
+        .. versionchanged:: 3.2.0
+
+            Added the ``force`` keyword-only argument. Calls which would not change the paused state are now skipped.
         """
-        assert self.guild is not None
+        if not force and value == self._paused:
+            return
 
         request: RequestPayload = {"paused": value}
-        await self.node._update_player(self.guild.id, data=request)
+        await self._update(request)
 
         self._paused = value
 
@@ -727,13 +813,11 @@ class Player(disnake.VoiceProtocol):
 
             The ``position`` parameter is now positional-only, and has a default of 0.
         """
-        assert self.guild is not None
-
         if not self._current:
             return
 
         request: RequestPayload = {"position": position}
-        await self.node._update_player(self.guild.id, data=request)
+        await self._update(request)
 
     async def set_filters(self, filters: Filters | None = None, /, *, seek: bool = False) -> None:
         """Set the :class:`wavelink.Filters` on the player.
@@ -758,19 +842,17 @@ class Player(disnake.VoiceProtocol):
 
             This method was previously known as ``set_filter``.
         """
-        assert self.guild is not None
-
         if filters is None:
             filters = Filters()
 
         request: RequestPayload = {"filters": filters()}
-        await self.node._update_player(self.guild.id, data=request)
+        await self._update(request)
         self._filters = filters
 
         if self.playing and seek:
             await self.seek(self.position)
 
-    async def set_volume(self, value: int = 100, /) -> None:
+    async def set_volume(self, value: int = 100, /, *, force: bool = False) -> None:
         """Set the :class:`Player` volume, as a percentage, between 0 and 1000.
 
         By default, every player is set to 100 on creation. If a value outside 0 to 1000 is provided it will be
@@ -780,17 +862,27 @@ class Player(disnake.VoiceProtocol):
         ----------
         value: int
             A volume value between 0 and 1000. To reset the player to 100, you can disregard this parameter.
+        force: bool
+            Whether to send the update to Lavalink even if the player is already set to this volume.
+            Defaults to ``False``.
 
 
         .. versionchanged:: 3.0.0
 
             The ``value`` parameter is now positional-only, and has a default of 100.
+
+
+        .. versionchanged:: 3.2.0
+
+            Added the ``force`` keyword-only argument. Calls which would not change the volume are now skipped.
         """
-        assert self.guild is not None
-        vol: int = max(min(value, 1000), 0)
+        vol: int = 0 if value < 0 else 1000 if value > 1000 else value
+
+        if not force and vol == self._volume:
+            return
 
         request: RequestPayload = {"volume": vol}
-        await self.node._update_player(self.guild.id, data=request)
+        await self._update(request)
 
         self._volume = vol
 
@@ -844,20 +936,100 @@ class Player(disnake.VoiceProtocol):
             This method was previously known as ``stop``. To avoid confusion this method is now known as ``skip``.
             This method now returns the :class:`~wavelink.Playable` that was skipped.
         """
-        assert self.guild is not None
         old: Playable | None = self._current
 
         if force:
             self.queue._loaded = None
 
         request: RequestPayload = {"track": {"encoded": None}}
-        await self.node._update_player(self.guild.id, data=request, replace=True)
+        await self._update(request, replace=True)
 
         return old
 
+    async def _update(self, data: RequestPayload, /, *, replace: bool = False) -> None:
+        if not self._guild_id_str:
+            raise InvalidChannelStateException("Player tried to update without a valid guild. Please connect first.")
+
+        if self._destroyed:
+            raise InvalidChannelStateException("Player tried to update after it was disconnected.")
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._pending_updates.append((data, replace, future))
+
+        # Updates are sent in order by a single consumer task, which runs until no updates are pending...
+        if self._update_task is None:
+            self._update_task = asyncio.create_task(self._consume_updates())
+
+        await future
+
+    async def _consume_updates(self) -> None:
+        pending: deque[PendingUpdate] = self._pending_updates
+
+        try:
+            while pending:
+                batch: list[PendingUpdate] = [pending.popleft()]
+                data, replace, _ = batch[0]
+
+                # Only simple field updates are merged. Track and replacing updates are always sent on their own...
+                if not replace and "track" not in data:
+                    while pending and not pending[0][1] and "track" not in pending[0][0]:
+                        batch.append(pending.popleft())
+
+                if len(batch) > 1:
+                    data = {}
+                    for update in batch:
+                        data.update(update[0])  # type: ignore
+
+                futures: list[asyncio.Future[None]] = [f for _, _, f in batch]
+                if await self._send_update(data, replace, futures):
+                    continue
+
+                # Lavalink rejected the merged update, send each individually so only the cause fails...
+                for update_data, update_replace, future in batch:
+                    await self._send_update(update_data, update_replace, [future])
+        finally:
+            if self._update_task is asyncio.current_task():
+                self._update_task = None
+
+    async def _send_update(self, data: RequestPayload, replace: bool, futures: list[asyncio.Future[None]], /) -> bool:
+        try:
+            await self.node._update_player(self._guild_id_str, data=data, replace=replace)
+        except asyncio.CancelledError:
+            self._fail_updates(futures)
+            raise
+        except LavalinkException as e:
+            if len(futures) > 1:
+                return False
+
+            self._fail_updates(futures, e)
+        except Exception as e:
+            self._fail_updates(futures, e)
+        else:
+            for future in futures:
+                if not future.done():
+                    future.set_result(None)
+
+        return True
+
+    def _fail_updates(self, futures: list[asyncio.Future[None]], exc: Exception | None = None, /) -> None:
+        if exc is None:
+            exc = InvalidChannelStateException("Player was destroyed before this update could be sent.")
+
+        for future in futures:
+            if not future.done():
+                future.set_exception(exc)
+
     def _invalidate(self) -> None:
         self._connected = False
-        self._connection_event.clear()
+        self._last_channel_id = 0
+
+        # Fail any connect() or move_to() still waiting, rather than reporting it as a timeout...
+        future: asyncio.Future[None] | None = self._connect_future
+        if future and not future.done():
+            msg: str = "Player was disconnected before the voice connection completed."
+            future.set_exception(InvalidChannelStateException(msg))
+            future.exception()  # Marks the exception as retrieved in case nothing is waiting.
+        self._connect_future = None
 
         try:
             self.cleanup()
@@ -865,16 +1037,26 @@ class Player(disnake.VoiceProtocol):
             pass
 
     async def _destroy(self) -> None:
-        assert self.guild
-
+        self._destroyed = True
         self._invalidate()
-        player: Player | None = self.node._players.pop(self.guild.id, None)
 
-        if player:
-            try:
-                await self.node._destroy_player(self.guild.id)
-            except LavalinkException:
-                pass
+        # Any updates still waiting to be sent would re-create the player on Lavalink...
+        if self._update_task is not None:
+            self._update_task.cancel()
+            self._update_task = None
+
+        pending: deque[PendingUpdate] = self._pending_updates
+        while pending:
+            self._fail_updates([pending.popleft()[2]])
+
+        node: Node = self.node
+        if node._players.pop(self._guild_id, None) is None:
+            return
+
+        try:
+            await node._destroy_player(self._guild_id_str)
+        except LavalinkException:
+            pass
 
     def _add_to_previous_seeds(self, seed: str) -> None:
         # Helper method to manage previous seeds.